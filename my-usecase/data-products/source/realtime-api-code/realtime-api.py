@@ -1,15 +1,123 @@
 import nilus
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import urllib.parse
 import base64
+import re
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from nilus import CustomSource
 
+try:
+    import orjson as _json  # Faster JSON decoding when available
+except ImportError:
+    import json as _json
+loads = _json.loads
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional; multi-location fetches fall back to the shared session
+    aiohttp = None
+
 # Configure logger
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# (connect, read) timeout in seconds for every API request, so a hung endpoint cannot stall a worker
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# Retry policy shared by the requests session and the aiohttp fetcher
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Shared HTTP session so repeated polls to the same host reuse keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=_RETRY_TOTAL,
+        connect=3,
+        read=2,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods={"GET"}
+    )
+))
+
+# Errors raised while talking to the API, as opposed to errors processing its response
+_FETCH_ERRORS = (requests.RequestException,) + ((aiohttp.ClientError, asyncio.TimeoutError) if aiohttp else ())
+
+def _fetch_error_message(error, location, apikey):
+    """Log a fetch or processing failure for one location and return its message with the apikey redacted."""
+    redacted_error = _redact(str(error), apikey)
+    if isinstance(error, _FETCH_ERRORS):
+        logger.error("Failed to fetch weather data for location: %s: %s", location, redacted_error)
+        return f"Failed to fetch weather data: {redacted_error}"
+    logger.error("Error processing API response for location: %s: %s", location, redacted_error)
+    return f"Error processing API response: {redacted_error}"
+
+# Parsed responses keyed by (base_url, location, units, apikey); realtime data changes slowly, so polls
+# within the TTL reuse the last response instead of calling the API again. The apikey is part of the key
+# so a source with a bad key gets its own auth error rather than another key's cached response.
+_RESPONSE_CACHE = {}
+DEFAULT_CACHE_TTL = 60.0
+
+def _cache_key(base_url, location, units, apikey):
+    """Build the response cache key for one request."""
+    return base_url, location, units, apikey
+
+def _cached_response(key, cache_ttl):
+    """Return the cached response for key if it has not expired, otherwise None; a TTL of 0 or less disables caching."""
+    if not (cache_ttl and cache_ttl > 0):
+        return None
+    hit = _RESPONSE_CACHE.get(key)
+    if hit is None:
+        return None
+    if hit[0] > time.monotonic():
+        return hit[1]
+    _RESPONSE_CACHE.pop(key, None)  # Drop the expired entry
+    return None
+
+def _cache_response(key, data, cache_ttl):
+    """Store a parsed response for cache_ttl seconds; a TTL of 0 or less disables caching."""
+    if cache_ttl and cache_ttl > 0:
+        now = time.monotonic()
+        # Sweep expired entries so the cache cannot grow without bound as locations change
+        for expired_key in [k for k, (expires_at, _) in _RESPONSE_CACHE.items() if expires_at <= now]:
+            _RESPONSE_CACHE.pop(expired_key, None)
+        _RESPONSE_CACHE[key] = (now + cache_ttl, data)
+
+def _get_json(full_url, key, cache_ttl):
+    """Fetch and parse full_url over the shared session, serving from the response cache while fresh."""
+    data = _cached_response(key, cache_ttl)
+    if data is None:
+        response = _SESSION.get(full_url, timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        data = loads(response.content)
+        _cache_response(key, data, cache_ttl)
+    return data
+
+# Matches an apikey query parameter wherever it appears in a URL or error message
+_APIKEY_RE = re.compile(r'apikey=[^&\s"\']+')
+
+def _redact(message, secret=None):
+    """Mask apikey query parameters in a message, plus any bare occurrence of the given secret."""
+    message = _APIKEY_RE.sub('apikey=***', message)
+    if secret:
+        message = message.replace(secret, '***')
+    return message
+
+@lru_cache(maxsize=64)
+def _decode_apikey(encoded_apikey: str) -> str:
+    """Decode a base64-encoded API key; cached since scheduled runs re-parse the same URI."""
+    return base64.b64decode(encoded_apikey).decode("utf-8").strip()
+
 # Helper function to flatten nested JSON dynamically
 def flatten_json(nested_json, parent_key='', separator='_'):
     """
@@ -17,31 +125,134 @@ def flatten_json(nested_json, parent_key='', separator='_'):
     
     Args:
         nested_json: The nested JSON object (dict or list).
-        parent_key: The parent key for nested structures (used in recursion).
+        parent_key: Prefix applied to all keys in the flattened output.
         separator: The separator for nested keys.
     
     Returns:
         A flattened dictionary.
     """
-    items = []
+    flattened = {}
     if isinstance(nested_json, dict):
-        for key, value in nested_json.items():
-            new_key = f"{parent_key}{separator}{key}" if parent_key else key
-            if isinstance(value, (dict, list)):
-                items.extend(flatten_json(value, new_key, separator).items())
-            else:
-                items.append((new_key, value))
+        items = iter(nested_json.items())
     elif isinstance(nested_json, list):
-        for i, value in enumerate(nested_json):
-            new_key = f"{parent_key}{separator}{i}" if parent_key else str(i)
+        items = zip(map(str, range(len(nested_json))), nested_json)
+    else:
+        return flattened
+    
+    # Walk a stack of (prefix, iterator) pairs instead of recursing: scalars are written straight into
+    # the output, and a nested container pauses its parent's iterator until it is exhausted, which
+    # keeps keys in the same depth-first order as the document
+    stack = [(parent_key, items)]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            if prefix:
+                key = f"{prefix}{separator}{key}"
             if isinstance(value, (dict, list)):
-                items.extend(flatten_json(value, new_key, separator).items())
-            else:
-                items.append((new_key, value))
-    return dict(items)
+                if isinstance(value, dict):
+                    stack.append((key, iter(value.items())))
+                else:
+                    stack.append((key, zip(map(str, range(len(value))), value)))
+                break
+            flattened[key] = value
+        else:
+            stack.pop()
+    return flattened
+    
+    # Walk an explicit worklist of (key, node) pairs instead of recursing; children are pushed
+    # in reverse so keys come out in the same depth-first order as the document
+    set_item = flattened.__setitem__
+    stack = [(parent_key, nested_json)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        key, node = pop()
+        if isinstance(node, dict):
+            children = [(f"{key}{separator}{k}" if key else k, v) for k, v in node.items()]
+        elif isinstance(node, list):
+            children = [(f"{key}{separator}{i}" if key else str(i), v) for i, v in enumerate(node)]
+        else:
+            set_item(key, node)
+            continue
+        for child in reversed(children):
+            push(child)
+    return flattened
+
+def _utc_load_datetime():
+    """Return the current UTC time as an ISO 8601 string with a 'Z' suffix (e.g., 2024-01-01T00:00:00Z)."""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z')
+
+# Request URL templates, filled once per source; location is not encoded to prevent double-encoding
+_URL_TEMPLATE_WITH_UNITS = "{base}{sep}location={loc}&units={units}&apikey={key}"
+_URL_TEMPLATE_NO_UNITS = "{base}{sep}location={loc}&apikey={key}"
+
+def _build_url(base_url, location, units, apikey):
+    """
+    Build the Tomorrow.io request URL with parameters in order: location, units, apikey.
+
+    Parameters are appended with '&' when base_url already carries a query string of its own.
+    """
+    sep = '&' if '?' in base_url else '?'
+    if units:
+        return _URL_TEMPLATE_WITH_UNITS.format(base=base_url, sep=sep, loc=location, units=units, key=apikey)
+    return _URL_TEMPLATE_NO_UNITS.format(base=base_url, sep=sep, loc=location, key=apikey)
+
+def _build_record(data, location, units, load_datetime):
+    """
+    Build a flattened weather record from a Tomorrow.io realtime API response.
+
+    Args:
+        data (dict): Parsed JSON response from the API.
+        location (str): Location the data was requested for (used for logging).
+        units (str, optional): Units the data was requested in.
+        load_datetime (str): UTC load timestamp added to the record.
+
+    Returns:
+        The flattened record, or None if the response contains no data.
+    """
+    # Log the raw response keys for debugging; skip building the key list unless DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("API response keys: %s", list(data.keys()))
+    
+    # For realtime API, extract the single data point
+    record = data.get('data', {})
+    if not record:
+        logger.warning("No data found in response for location: %s", location)
+        return None
+    
+    # Extract latitude and longitude from API response
+    location_info = data.get('location', {})
+    latitude = location_info.get('lat')
+    longitude = location_info.get('lon')  # Tomorrow.io uses 'lon' for longitude
+    
+    if latitude is None or longitude is None:
+        logger.warning("Latitude or longitude not found in API response for location: %s", location)
+    
+    # Extract time from API response
+    record_time = record.get('time')
+    if not record_time:
+        logger.warning("No time found in API response for location: %s", location)
+    
+    # Tomorrow.io returns a flat dict of scalar 'values', so a shallow copy is enough; anything else
+    # (nested values, or a list) goes through flatten_json
+    values = record.get('values', {}) or {}
+    if isinstance(values, dict) and not any(isinstance(value, (dict, list)) for value in values.values()):
+        flattened_record = dict(values)
+    else:
+        flattened_record = flatten_json(values)
+    
+    # Add additional columns
+    flattened_record['latitude'] = latitude
+    flattened_record['longitude'] = longitude
+    flattened_record['time'] = record_time
+    flattened_record['load_datetime'] = load_datetime
+    flattened_record['units'] = units if units else 'metric'  # Default to 'metric' per API documentation
+    
+    return flattened_record
 
 @nilus.source
-def weather_source(base_url: str, location: str, units: str = None, apikey: str = None, table: str = None):
+def weather_source(base_url: str, location: str, units: str = None, apikey: str = None, table: str = None,
+                   cache_ttl: float = DEFAULT_CACHE_TTL):
     """
     Retrieves realtime weather data from the Tomorrow.io Weather API and appends it to the specified table.
     This source fetches weather data for the given location, which can be in formats like latitude,longitude
@@ -56,6 +267,7 @@ def weather_source(base_url: str, location: str, units: str = None, apikey: str
         units (str, optional): Units for the weather data ('metric' or 'imperial', defaults to 'metric' if not specified).
         apikey (str): Decoded API key for Tomorrow.io.
         table (str): Table name to store the weather data (e.g., 'realtime_data01').
+        cache_ttl (float, optional): Seconds a response is reused for repeated polls of the same location (0 disables).
     """
     if not table or not isinstance(table, str):
         raise ValueError("table must be a non-empty string")
@@ -66,74 +278,30 @@ def weather_source(base_url: str, location: str, units: str = None, apikey: str
     if not apikey or not isinstance(apikey, str):
         raise ValueError("apikey must be a non-empty string")
     
-    # Construct the API URL with parameters in order: base_url, location, units, apikey
-    query_params = []
-    query_params.append(f"location={location}")  # Avoid encoding location to prevent double-encoding
-    if units:
-        query_params.append(f"units={units}")
-    query_params.append(f"apikey={apikey}")
-    query_string = "&".join(query_params)
-    full_url = f"{base_url}?{query_string}"
+    # Construct the API URL once; it is fixed for the lifetime of the source
+    full_url = _build_url(base_url, location, units, apikey)
     
     # Redact apikey for logging
-    redacted_url = f"{base_url}?location={location}&units={units}&apikey=***" if units else f"{base_url}?location={location}&apikey=***"
-    logger.info(f"Fetching weather data from: {redacted_url}")
+    redacted_url = _build_url(base_url, location, units, '***')
+    logger.info("Fetching weather data from: %s", redacted_url)
     
     def weather_records():
-        load_datetime = datetime.utcnow().isoformat() + 'Z'  # UTC datetime in ISO format, same for all records
+        # The realtime API returns a single data point, so return a list rather than running a generator
+        load_datetime = _utc_load_datetime()  # UTC datetime in ISO format, same for all records
         
         try:
-            # Make the API request
-            response = requests.get(full_url)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Log the raw response keys for debugging
-            logger.info(f"API response keys: {list(data.keys())}")
-            
-            # For realtime API, extract the single data point
-            record = data.get('data', {})
-            if not record:
-                logger.warning(f"No data found in response for location: {location}")
-                return
+            # Make the API request, unless a fresh response is already cached
+            data = _get_json(full_url, _cache_key(base_url, location, units, apikey), cache_ttl)
             
-            # Extract latitude and longitude from API response
-            location_info = data.get('location', {})
-            latitude = location_info.get('lat')
-            longitude = location_info.get('lon')  # Tomorrow.io uses 'lon' for longitude
+            flattened_record = _build_record(data, location, units, load_datetime)
+            if flattened_record is None:
+                return []
             
-            if latitude is None or longitude is None:
-                logger.warning(f"Latitude or longitude not found in API response for location: {location}")
-            
-            # Extract time from API response
-            record_time = record.get('time')
-            if not record_time:
-                logger.warning(f"No time found in API response for location: {location}")
-            
-            # Flatten the 'values' field
-            values = record.get('values', {})
-            flattened_record = flatten_json(values)
-            
-            # Add additional columns
-            flattened_record['latitude'] = latitude
-            flattened_record['longitude'] = longitude
-            flattened_record['time'] = record_time
-            flattened_record['load_datetime'] = load_datetime
-            flattened_record['units'] = units if units else 'metric'  # Default to 'metric' per API documentation
-            
-            logger.info(f"Yielding flattened record for table {table}: {flattened_record}")
-            yield flattened_record
+            logger.debug("Returning flattened record for table %s: %s", table, flattened_record)
+            return [flattened_record]
                 
-        except requests.RequestException as e:
-            # Redact apikey in error message
-            redacted_error = str(e).replace(apikey, '***') if apikey in str(e) else str(e)
-            logger.error(f"Failed to fetch weather data for location: {location}: {redacted_error}")
-            raise ValueError(f"Failed to fetch weather data: {redacted_error}")
         except Exception as e:
-            # Redact apikey in error message
-            redacted_error = str(e).replace(apikey, '***') if apikey in str(e) else str(e)
-            logger.error(f"Error processing API response for location: {location}: {redacted_error}")
-            raise ValueError(f"Error processing API response: {redacted_error}")
+            raise ValueError(_fetch_error_message(e, location, apikey))
     
     # Yield the resource with specified parameters, ensuring table is last
     yield nilus.resource(
@@ -142,106 +310,334 @@ def weather_source(base_url: str, location: str, units: str = None, apikey: str
         table_name=table  # Table is the last parameter in the source configuration
     )
 
+async def _fetch_one(session, url):
+    """
+    Fetch a single weather API URL and return the parsed JSON response.
+
+    Retries 429/5xx responses and connection errors with the same policy as the shared requests session,
+    honouring a numeric Retry-After header when the API sends one.
+    """
+    for attempt in range(_RETRY_TOTAL + 1):
+        delay = _RETRY_BACKOFF * (2 ** attempt)
+        try:
+            async with session.get(url) as response:
+                if response.status not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                    response.raise_for_status()
+                    return loads(await response.read())
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = float(retry_after)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == _RETRY_TOTAL:
+                raise
+        await asyncio.sleep(delay)
+
+async def _fetch_located(session, location, url):
+    # Pair each result with its location so results can be consumed in completion order; failures are
+    # returned rather than raised so one bad location does not abort the others
+    try:
+        return location, await _fetch_one(session, url), None
+    except Exception as e:
+        return location, None, e
+
+async def _fetch_all(locations, urls):
+    connector = aiohttp.TCPConnector(limit=32)
+    timeout = aiohttp.ClientTimeout(sock_connect=_REQUEST_TIMEOUT[0], sock_read=_REQUEST_TIMEOUT[1])
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        tasks = [asyncio.ensure_future(_fetch_located(session, location, url)) for location, url in zip(locations, urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Cancel anything still in flight if the consumer stops early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+def weather_records_async(base_url: str, locations: list, units: str = None, apikey: str = None,
+                          cache_ttl: float = DEFAULT_CACHE_TTL):
+    """
+    Fetch realtime weather data for several locations concurrently.
+
+    All requests are issued together over one aiohttp ClientSession and yielded as each one completes,
+    so wall time is roughly one round trip instead of one per location. Falls back to sequential requests
+    on the shared requests session when aiohttp is not installed.
+
+    Args:
+        base_url (str): Base URL for the Tomorrow.io API.
+        locations (list[str]): Locations to fetch weather data for.
+        units (str, optional): Units for the weather data ('metric' or 'imperial').
+        apikey (str): Decoded API key for Tomorrow.io.
+        cache_ttl (float, optional): Seconds a response is reused for repeated polls of the same location (0 disables).
+
+    Yields:
+        (location, data, error) tuples for each location: the parsed JSON response and None on success,
+        or None and the exception raised when the request for that location failed.
+    """
+    # Serve fresh cached responses straight away and only request the rest
+    pending = []
+    for location in locations:
+        data = _cached_response(_cache_key(base_url, location, units, apikey), cache_ttl)
+        if data is not None:
+            yield location, data, None
+        else:
+            pending.append(location)
+    if not pending:
+        return
+    urls = [_build_url(base_url, location, units, apikey) for location in pending]
+
+    if aiohttp is None:
+        for location, url in zip(pending, urls):
+            try:
+                data = _get_json(url, _cache_key(base_url, location, units, apikey), cache_ttl)
+            except Exception as e:
+                yield location, None, e
+            else:
+                yield location, data, None
+        return
+
+    # Drive the async generator step by step so records stream to the sink as they arrive
+    loop = asyncio.new_event_loop()
+    results = _fetch_all(pending, urls)
+    try:
+        while True:
+            try:
+                location, data, error = loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                break
+            if error is None:
+                _cache_response(_cache_key(base_url, location, units, apikey), data, cache_ttl)
+            yield location, data, error
+    finally:
+        loop.run_until_complete(results.aclose())
+        loop.close()
+
+@nilus.source
+def weather_multi_source(targets: list, table: str = None, cache_ttl: float = DEFAULT_CACHE_TTL):
+    """
+    Retrieves realtime weather data for several locations from the Tomorrow.io Weather API in one run and
+    appends it to the specified table. Targets sharing a base_url, units and apikey are fetched concurrently
+    through weather_records_async. Records have the same shape as those produced by weather_source.
+    A failing location is logged and skipped so the remaining locations still load; the run then fails
+    with a single error listing every failed location.
+
+    Args:
+        targets (list[tuple]): (base_url, location, units, apikey) tuples, e.g. as parsed from source URIs.
+        table (str): Table name to store the weather data (e.g., 'realtime_data01').
+        cache_ttl (float, optional): Seconds a response is reused for repeated polls of the same location (0 disables).
+    """
+    if not table or not isinstance(table, str):
+        raise ValueError("table must be a non-empty string")
+    if not targets:
+        raise ValueError("targets must be a non-empty list")
+
+    # Group locations by the request parameters they share; each group is one concurrent fetch
+    groups = {}
+    for base_url, location, units, apikey in targets:
+        groups.setdefault((base_url, units, apikey), []).append(location)
+
+    logger.info("Fetching weather data for %d locations in %d request groups", len(targets), len(groups))
+
+    def weather_records():
+        load_datetime = _utc_load_datetime()  # UTC datetime in ISO format, same for all records
+
+        failures = []
+
+        for (base_url, units, apikey), locations in groups.items():
+            for location, data, error in weather_records_async(base_url, locations, units, apikey, cache_ttl):
+                if error is None:
+                    try:
+                        flattened_record = _build_record(data, location, units, load_datetime)
+                    except Exception as e:
+                        error = e
+                if error is not None:
+                    failures.append(f"{location}: {_fetch_error_message(error, location, apikey)}")
+                    continue
+                if flattened_record is None:
+                    continue
+
+                logger.debug("Yielding flattened record for table %s: %s", table, flattened_record)
+                yield flattened_record
+
+        # Fail the run only after every good record has been yielded
+        if failures:
+            raise ValueError(f"Failed to load weather data for {len(failures)} of {len(targets)} locations: "
+                             + "; ".join(failures))
+
+    yield nilus.resource(
+        weather_records,
+        name="weather_api",
+        table_name=table
+    )
+
 class WeatherRealtimeApiSource(CustomSource):
     def handles_incrementality(self) -> bool:
         # This source does not support incremental loading; it fetches and appends all data each time
         return False
 
-    def nilus_source(self, uri: str, table: str, **kwargs):
+    def _cache_ttl(self, options: dict) -> float:
         """
-        Constructs the Nilus source from a URI containing the full API URL with plain-text location and units,
-        and base64-encoded API key.
+        Reads the response cache TTL from the source options ('cache-ttl' or 'cache_ttl', in seconds).
+
+        Raises:
+            ValueError: If the option is set but is not a number.
+        """
+        cache_ttl = options.get("cache-ttl", options.get("cache_ttl"))
+        if cache_ttl is None:
+            return DEFAULT_CACHE_TTL
+        try:
+            return float(cache_ttl)
+        except (TypeError, ValueError):
+            logger.error("Invalid cache-ttl option: %s", cache_ttl)
+            raise ValueError(f"cache-ttl must be a number of seconds, got: {cache_ttl!r}") from None
+
+    def _parse_uri(self, uri: str):
+        """
+        Parses a source URI into the parameters needed to call the weather API.
 
         Args:
-            uri (str): URI containing the full weather API URL as a query param
-                       (e.g., custom://WeatherRealtimeApiSource?url=https://api.tomorrow.io/v4/weather/realtime?location=12.9155151,77.6158726&units=metric&apikey={encoded_key}).
-            table (str): Table name to store the weather data (e.g., 'realtime_data01').
+            uri (str): URI containing the full weather API URL as a query param (see nilus_source).
 
         Returns:
-            The Nilus source for the weather API data.
+            A (base_url, location, units, apikey) tuple with the apikey already decoded.
 
         Raises:
             ValueError: If URI is invalid, required parameters are missing, or apikey decoding fails.
         """
         # Redact apikey in URI for logging
-        redacted_uri = uri
-        if 'apikey=' in uri:
-            redacted_uri = uri[:uri.index('apikey=')] + 'apikey=***'
-        logger.info(f"Parsing URI: {redacted_uri}")
+        redacted_uri = _redact(uri)
+        logger.info("Parsing URI: %s", redacted_uri)
 
+        # Parse the URI and extract full_url manually
         try:
-            # Parse the URI and extract full_url manually
             parsed_uri = urllib.parse.urlparse(uri)
-            if not parsed_uri.query.startswith('url='):
-                logger.error(f"Expected 'url=' as query parameter in URI: {redacted_uri}")
-                raise ValueError("Missing 'url' parameter in URI")
-            
-            # Extract everything after 'url=' and unquote it
-            full_url = urllib.parse.unquote(parsed_uri.query[4:])
-            if not full_url:
-                logger.error(f"Empty 'url' value in URI: {redacted_uri}")
-                raise ValueError("Empty 'url' value in URI")
-            
-            # Redact apikey in full_url for logging
-            redacted_full_url = full_url
-            if 'apikey=' in full_url:
-                redacted_full_url = full_url[:full_url.index('apikey=')] + 'apikey=***'
-            logger.info(f"Extracted full_url: {redacted_full_url}")
+        except ValueError as e:
+            redacted_error = _redact(str(e))
+            logger.error("Failed to parse URI: %s, error: %s", redacted_uri, redacted_error)
+            raise ValueError(f"Invalid URI: {redacted_error}") from None
+        if not parsed_uri.query.startswith('url='):
+            logger.error("Expected 'url=' as query parameter in URI: %s", redacted_uri)
+            raise ValueError("Missing 'url' parameter in URI")
+        
+        # Extract everything after 'url=' and unquote it once, in case the inner URL was percent-encoded
+        full_url = urllib.parse.unquote(parsed_uri.query[4:])
+        if not full_url:
+            logger.error("Empty 'url' value in URI: %s", redacted_uri)
+            raise ValueError("Empty 'url' value in URI")
+        
+        # Redact apikey in full_url for logging
+        redacted_full_url = _redact(full_url)
+        logger.info("Extracted full_url: %s", redacted_full_url)
 
-            # Parse the full_url to extract base_url, location, units, and apikey
+        # Parse the full_url to extract base_url, location, units, and apikey
+        try:
             parsed_full_url = urllib.parse.urlparse(full_url)
-            url_query_params = urllib.parse.parse_qs(parsed_full_url.query, keep_blank_values=True)
-            
-            # Extract parameters in order: base_url, location, units, apikey
-            location = url_query_params.get("location", [None])[0]
-            units = url_query_params.get("units", [None])[0]
-            encoded_apikey = url_query_params.get("apikey", [None])[0]
-            
-            if not location:
-                logger.error(f"No 'location' parameter found in URL query: {redacted_full_url}")
-                raise ValueError("Missing required 'location' in URL query parameters")
-            if not encoded_apikey:
-                logger.error(f"No 'apikey' parameter found in URL query: {redacted_full_url}")
-                raise ValueError("Missing required 'apikey' in URL query parameters")
-            
-            # Clean location (plain text, not base64-encoded)
-            location = urllib.parse.unquote(location).strip()
-            if not location:
-                logger.error(f"Location is empty after cleaning: {location}")
-                raise ValueError("Location is empty after cleaning")
-            
-            # Construct base_url by removing location, units, and apikey from query
-            clean_query = {k: v for k, v in url_query_params.items() if k not in ["location", "units", "apikey"]}
-            clean_query_string = urllib.parse.urlencode(clean_query, doseq=True)
-            base_url = f"{parsed_full_url.scheme}://{parsed_full_url.netloc}{parsed_full_url.path}"
-            if clean_query_string:
-                base_url += f"?{clean_query_string}"
-            
-            if not base_url:
-                logger.error(f"Failed to extract base_url from: {redacted_full_url}")
-                raise ValueError("Invalid base_url in URL")
-            
-            # Decode base64-encoded apikey
-            try:
-                apikey = base64.b64decode(encoded_apikey).decode("utf-8").strip()
-                logger.info(f"Weather API credentials decoded successfully for location: {location}")
-            except (TypeError, base64.binascii.Error, UnicodeDecodeError) as e:
-                # Redact apikey in error message
-                redacted_error = str(e).replace(encoded_apikey, '***') if encoded_apikey in str(e) else str(e)
-                logger.error(f"Failed to decode base64-encoded apikey for location: {location}: {redacted_error}")
-                raise ValueError(f"Invalid or missing base64-encoded apikey in URL: {redacted_error}")
-                
-        except Exception as e:
+            query_pairs = urllib.parse.parse_qsl(parsed_full_url.query, keep_blank_values=True)
+        except ValueError as e:
+            redacted_error = _redact(str(e))
+            logger.error("Failed to parse URL: %s, error: %s", redacted_full_url, redacted_error)
+            raise ValueError(f"Invalid 'url' value in URI: {redacted_error}") from None
+        
+        # Split the query into the known parameters and everything else in a single pass
+        known_params = {}
+        other_params = []
+        for key, value in query_pairs:
+            if key in ("location", "units", "apikey"):
+                known_params.setdefault(key, value)  # First occurrence wins, as with parse_qs
+            else:
+                other_params.append((key, value))
+        
+        # Extract parameters in order: base_url, location, units, apikey
+        location = known_params.get("location")
+        units = known_params.get("units")
+        encoded_apikey = known_params.get("apikey")
+        
+        if not location:
+            logger.error("No 'location' parameter found in URL query: %s", redacted_full_url)
+            raise ValueError("Missing required 'location' in URL query parameters")
+        if not encoded_apikey:
+            logger.error("No 'apikey' parameter found in URL query: %s", redacted_full_url)
+            raise ValueError("Missing required 'apikey' in URL query parameters")
+        
+        # Clean location (plain text, not base64-encoded); parse_qsl has already percent-decoded it
+        location = location.strip()
+        if not location:
+            logger.error("Location is empty after cleaning: %s", location)
+            raise ValueError("Location is empty after cleaning")
+        
+        # Construct base_url by removing location, units, and apikey from query
+        clean_query_string = urllib.parse.urlencode(other_params)
+        base_url = f"{parsed_full_url.scheme}://{parsed_full_url.netloc}{parsed_full_url.path}"
+        if clean_query_string:
+            base_url += f"?{clean_query_string}"
+        
+        if not base_url:
+            logger.error("Failed to extract base_url from: %s", redacted_full_url)
+            raise ValueError("Invalid base_url in URL")
+        
+        # Decode base64-encoded apikey
+        try:
+            apikey = _decode_apikey(encoded_apikey)
+            logger.info("Weather API credentials decoded successfully for location: %s", location)
+        except ValueError as e:  # Covers binascii.Error, UnicodeDecodeError and non-ASCII input
             # Redact apikey in error message
-            redacted_error = str(e).replace(encoded_apikey, '***') if 'encoded_apikey' in locals() and encoded_apikey in str(e) else str(e)
-            logger.error(f"Failed to parse URI: {redacted_uri}, error: {redacted_error}")
-            raise ValueError(f"Invalid or missing parameters in URI: {redacted_error}")
+            redacted_error = _redact(str(e), encoded_apikey)
+            logger.error("Failed to decode base64-encoded apikey for location: %s: %s", location, redacted_error)
+            raise ValueError(f"Invalid or missing base64-encoded apikey in URL: {redacted_error}") from None
         
-        logger.info(f"Creating Weather API source for table: {table} with location: {location}")
+        return base_url, location, units, apikey
+
+    def nilus_source(self, uri: str, table: str, **kwargs):
+        """
+        Constructs the Nilus source from a URI containing the full API URL with plain-text location and units,
+        and base64-encoded API key.
+
+        Args:
+            uri (str): URI containing the full weather API URL as a query param
+                       (e.g., custom://WeatherRealtimeApiSource?url=https://api.tomorrow.io/v4/weather/realtime?location=12.9155151,77.6158726&units=metric&apikey={encoded_key}).
+            table (str): Table name to store the weather data (e.g., 'realtime_data01').
+            **kwargs: Source options; 'cache-ttl' sets how many seconds a response is reused (0 disables caching).
+
+        Returns:
+            The Nilus source for the weather API data.
+
+        Raises:
+            ValueError: If URI is invalid, required parameters are missing, apikey decoding fails, or cache-ttl is not a number.
+        """
+        base_url, location, units, apikey = self._parse_uri(uri)
+        cache_ttl = self._cache_ttl(kwargs)
+        
+        logger.info("Creating Weather API source for table: %s with location: %s", table, location)
         return weather_source(
             base_url=base_url,
             location=location,
             units=units,
             apikey=apikey,
-            table=table
-        )
\ No newline at end of file
+            table=table,
+            cache_ttl=cache_ttl
+        )
+
+    def nilus_sources(self, uris: list, table: str, **kwargs):
+        """
+        Constructs a single Nilus source that fetches weather data for several URIs in one run; URIs that
+        share a base URL, units and apikey are fetched concurrently instead of one source per location.
+
+        Args:
+            uris (list[str]): URIs in the same format accepted by nilus_source.
+            table (str): Table name to store the weather data (e.g., 'realtime_data01').
+            **kwargs: Source options; 'cache-ttl' sets how many seconds a response is reused (0 disables caching).
+
+        Returns:
+            The Nilus source for the weather API data of all URIs.
+
+        Raises:
+            ValueError: If no URIs are given, any URI is invalid, or cache-ttl is not a number.
+        """
+        if not uris:
+            raise ValueError("uris must be a non-empty list")
+        
+        targets = [self._parse_uri(uri) for uri in uris]
+        cache_ttl = self._cache_ttl(kwargs)
+        
+        logger.info("Creating Weather API batch source for table: %s with %d locations", table, len(targets))
+        return weather_multi_source(targets=targets, table=table, cache_ttl=cache_ttl)